@@ -22,6 +22,8 @@ Dependencies:
 Optional:
 - OpenSCAD CLI installed (for .scad -> .stl):
   macOS: brew install openscad
+- orjson (faster .json manifest parsing):
+  pip install orjson
 
 Usage:
   python cad_assembly.py manifest.yaml --out assembly.step --outglb assembly.glb
@@ -54,15 +56,21 @@ Manifest example (YAML):
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
 import math
 import os
 import shutil
 import subprocess
+import struct
 import sys
+import types
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Set, Tuple, Union
 
 import numpy as np
 
@@ -71,21 +79,43 @@ try:
 except Exception:
     yaml = None
 
-import trimesh  # type: ignore
-import cadquery as cq  # type: ignore
+# libyaml-backed loader when available; falls back to the pure-Python SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+# cadquery (with OCP) and trimesh take seconds to import, so they are imported
+# inside the functions that use them; --help and manifest errors stay fast.
+if TYPE_CHECKING:
+    import cadquery as cq  # type: ignore
+    import trimesh  # type: ignore
+    from OCP.gp import gp_Trsf  # type: ignore
 
 
 # ----------------------------
 # Helpers: IO / manifest
 # ----------------------------
 
+# Shared read-only default for optional manifest sections (avoids a fresh {} per lookup)
+_EMPTY: Mapping[str, Any] = types.MappingProxyType({})
+
+
 def load_manifest(path: Path) -> Dict[str, Any]:
-    data = path.read_text(encoding="utf-8")
     if path.suffix.lower() in [".yaml", ".yml"]:
         if yaml is None:
             raise RuntimeError("pyyaml not installed. Run: pip install pyyaml")
-        return yaml.safe_load(data)
+        # libyaml reads raw bytes directly (skips the utf-8 decode)
+        return yaml.load(path.read_bytes(), Loader=_YAML_LOADER)
     if path.suffix.lower() == ".json":
+        data = path.read_bytes()
+        if orjson is not None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN/Infinity literals, which only json accepts
         return json.loads(data)
     raise ValueError(f"Unsupported manifest type: {path.suffix} (use .yaml/.yml/.json)")
 
@@ -102,66 +132,99 @@ def which(cmd: str) -> Optional[str]:
 # Units and transforms
 # ----------------------------
 
+_MM_PER_UNIT = {
+    "mm": 1.0, "millimeter": 1.0, "millimeters": 1.0,
+    "in": 25.4, "inch": 25.4, "inches": 25.4,  # inch -> mm
+}
+
+
 def unit_scale(units: str) -> float:
-    u = (units or "mm").lower()
-    if u in ("mm", "millimeter", "millimeters"):
-        return 1.0
-    if u in ("in", "inch", "inches"):
-        return 25.4  # inch -> mm
-    raise ValueError(f"Unsupported units: {units}")
+    scale = _MM_PER_UNIT.get((units or "mm").lower())
+    if scale is None:
+        raise ValueError(f"Unsupported units: {units}")
+    return scale
 
 
-def deg2rad(v: Union[float, int]) -> float:
-    return float(v) * math.pi / 180.0
+_DEG2RAD = math.pi / 180.0
 
 
 def xform_to_location(
     t: Tuple[float, float, float],
     r_deg: Tuple[float, float, float],
     s: float,
-    units_mm_per_unit: float,
+    units_mm_per_unit: float = 1.0,
 ) -> cq.Location:
     """
     CadQuery Location:
-    - translation in mm
-    - rotation is applied in ZYX order here (yaw/pitch/roll-ish)
+    - translation in mm (t is already in mm with the default units_mm_per_unit=1.0)
+    - rotation X then Y then Z, same as xform_to_matrix
+    Scale is not part of a Location; it's applied to the geometry itself.
     """
-    tx, ty, tz = [float(x) * units_mm_per_unit for x in t]
-    rx, ry, rz = [deg2rad(x) for x in r_deg]
+    import cadquery as cq  # type: ignore
 
-    # CadQuery uses gp_Trsf via Location; easiest is combine:
-    loc = cq.Location()
+    if abs(float(r_deg[0])) + abs(float(r_deg[1])) + abs(float(r_deg[2])) < 1e-12:
+        # no rotation: skip building a matrix / gp_Trsf
+        tx, ty, tz = np.asarray(t, dtype=float) * units_mm_per_unit
+        if tx == ty == tz == 0.0:
+            return cq.Location()
+        return cq.Location(cq.Vector(tx, ty, tz))
+    R, t_mm = xform_to_matrix(t, r_deg, units_mm_per_unit)
+    return matrix_to_location(R, t_mm)
 
-    # scale: CadQuery Location doesn't do uniform scale directly.
-    # We'll scale geometry itself pre-add (for meshes + shapes).
-    # Translation + rotation in loc only.
-    # Rotation order: X then Y then Z.
-    if abs(rx) > 1e-12:
-        loc = loc * cq.Location(cq.Vector(0, 0, 0), cq.Vector(1, 0, 0), rx)
-    if abs(ry) > 1e-12:
-        loc = loc * cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 1, 0), ry)
-    if abs(rz) > 1e-12:
-        loc = loc * cq.Location(cq.Vector(0, 0, 0), cq.Vector(0, 0, 1), rz)
 
-    loc = cq.Location(cq.Vector(tx, ty, tz)) * loc
-    return loc
+def rotation_matrix_xyz(r_deg: Tuple[float, float, float]) -> np.ndarray:
+    """
+    3×3 rotation Rx @ Ry @ Rz for XYZ Euler angles in degrees, written out in closed form.
+    Memoized on the exact angles (manifests reuse a handful); the returned array is read-only.
+    """
+    return _rotation_matrix_xyz(float(r_deg[0]), float(r_deg[1]), float(r_deg[2]))
+
+
+@functools.lru_cache(maxsize=512)
+def _rotation_matrix_xyz(rx_deg: float, ry_deg: float, rz_deg: float) -> np.ndarray:
+    rx, ry, rz = rx_deg * _DEG2RAD, ry_deg * _DEG2RAD, rz_deg * _DEG2RAD
+    cx, sx = math.cos(rx), math.sin(rx)
+    cy, sy = math.cos(ry), math.sin(ry)
+    cz, sz = math.cos(rz), math.sin(rz)
+    R = np.array([
+        [cy * cz, -cy * sz, sy],
+        [sx * sy * cz + cx * sz, cx * cz - sx * sy * sz, -sx * cy],
+        [sx * sz - cx * sy * cz, cx * sy * sz + sx * cz, cx * cy],
+    ], dtype=float)
+    R.setflags(write=False)
+    return R
 
 
 def xform_to_matrix(
     t: Tuple[float, float, float],
     r_deg: Tuple[float, float, float],
-    units_mm_per_unit: float,
+    units_mm_per_unit: float = 1.0,
 ) -> Tuple[np.ndarray, np.ndarray]:
-    """Returns (R 3×3, t_mm 3-vector) matching the rotation convention of xform_to_location."""
-    tx, ty, tz = [float(x) * units_mm_per_unit for x in t]
-    rx, ry, rz = [deg2rad(x) for x in r_deg]
-    cx, sx = math.cos(rx), math.sin(rx)
-    cy, sy = math.cos(ry), math.sin(ry)
-    cz, sz = math.cos(rz), math.sin(rz)
-    Rx = np.array([[1, 0, 0], [0, cx, -sx], [0, sx, cx]], dtype=float)
-    Ry = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]], dtype=float)
-    Rz = np.array([[cz, -sz, 0], [sz, cz, 0], [0, 0, 1]], dtype=float)
-    return Rx @ Ry @ Rz, np.array([tx, ty, tz], dtype=float)
+    """Returns (R 3×3 = Rx @ Ry @ Rz, t_mm 3-vector) for a manifest xform."""
+    return rotation_matrix_xyz(r_deg).copy(), np.asarray(t, dtype=float) * units_mm_per_unit
+
+
+def xform_to_matrix_batch(
+    ts: np.ndarray,
+    rs_deg: np.ndarray,
+    units_mm_per_unit: float = 1.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized xform_to_matrix: (N,3) translations + (N,3) XYZ angles -> (Rs (N,3,3), ts_mm (N,3))."""
+    ts_mm = np.asarray(ts, dtype=float).reshape(-1, 3) * units_mm_per_unit
+    rs = np.deg2rad(np.asarray(rs_deg, dtype=float).reshape(-1, 3))
+    cx, cy, cz = np.cos(rs).T
+    sx, sy, sz = np.sin(rs).T
+    Rs = np.empty((rs.shape[0], 3, 3), dtype=float)
+    Rs[:, 0, 0] = cy * cz
+    Rs[:, 0, 1] = -cy * sz
+    Rs[:, 0, 2] = sy
+    Rs[:, 1, 0] = sx * sy * cz + cx * sz
+    Rs[:, 1, 1] = cx * cz - sx * sy * sz
+    Rs[:, 1, 2] = -sx * cy
+    Rs[:, 2, 0] = sx * sz - cx * sy * cz
+    Rs[:, 2, 1] = cx * sy * sz + sx * cz
+    Rs[:, 2, 2] = cx * cy
+    return Rs, ts_mm
 
 
 def rotation_matrix_from_vectors(a: np.ndarray, b: np.ndarray) -> np.ndarray:
@@ -170,110 +233,246 @@ def rotation_matrix_from_vectors(a: np.ndarray, b: np.ndarray) -> np.ndarray:
     b = b / np.linalg.norm(b)
     c = float(np.dot(a, b))
     if abs(c + 1.0) < 1e-9:  # antiparallel: 180° around any perpendicular axis
-        perp = np.array([1.0, 0.0, 0.0]) if abs(a[0]) < 0.9 else np.array([0.0, 1.0, 0.0])
-        ax = np.cross(a, perp)
-        ax /= np.linalg.norm(ax)
+        # a × x̂ or a × ŷ, written out and normalized in one step
+        if abs(a[0]) < 0.9:
+            ax = np.array([0.0, a[2], -a[1]]) / math.hypot(a[1], a[2])
+        else:
+            ax = np.array([-a[2], 0.0, a[0]]) / math.hypot(a[0], a[2])
         return 2.0 * np.outer(ax, ax) - np.eye(3)
     v = np.cross(a, b)
     s = float(np.linalg.norm(v))
-    kmat = np.array([[0.0, -v[2], v[1]], [v[2], 0.0, -v[0]], [-v[1], v[0], 0.0]])
-    return np.eye(3) + kmat + kmat @ kmat * ((1.0 - c) / (s * s + 1e-30))
+    if s < 1e-15:  # already aligned
+        return np.eye(3)
+    # Rodrigues: R = cosθ·I + (1 - cosθ)·uuᵀ + sinθ·[u]×
+    u = v / s
+    K = np.array([[0.0, -u[2], u[1]], [u[2], 0.0, -u[0]], [-u[1], u[0], 0.0]])
+    return c * np.eye(3) + (1.0 - c) * np.outer(u, u) + s * K
+
+
+@functools.lru_cache(maxsize=None)
+def _trsf_scratch() -> Tuple[gp_Trsf, np.ndarray]:
+    """
+    Scratch gp_Trsf + (3,4) value buffer reused by matrix_to_location;
+    TopLoc_Location copies the transform, so reusing the scratch is safe.
+    """
+    from OCP.gp import gp_Trsf  # type: ignore
+
+    return gp_Trsf(), np.empty((3, 4))
+
+
+def _fill_trsf(trsf: gp_Trsf, buf: np.ndarray, R: np.ndarray, t: np.ndarray) -> None:
+    """Set trsf from R (3×3) and t (3,) via one contiguous [R | t] buffer."""
+    buf[:, :3] = R
+    buf[:, 3] = t
+    trsf.SetValues(*buf.ravel().tolist())
 
 
 def matrix_to_location(R: np.ndarray, t: np.ndarray) -> cq.Location:
     """Build a cq.Location from a 3×3 rotation matrix R and translation vector t (mm)."""
-    from OCP.gp import gp_Trsf
-    from OCP.TopLoc import TopLoc_Location
-    trsf = gp_Trsf()
-    trsf.SetValues(
-        float(R[0, 0]), float(R[0, 1]), float(R[0, 2]), float(t[0]),
-        float(R[1, 0]), float(R[1, 1]), float(R[1, 2]), float(t[1]),
-        float(R[2, 0]), float(R[2, 1]), float(R[2, 2]), float(t[2]),
-    )
+    import cadquery as cq  # type: ignore
+    from OCP.TopLoc import TopLoc_Location  # type: ignore
+
+    trsf, buf = _trsf_scratch()
+    _fill_trsf(trsf, buf, R, t)
     return cq.Location(TopLoc_Location(trsf))
 
 
-def resolve_mate(
-    p: Dict[str, Any],
-    part_world: Dict[str, Tuple[np.ndarray, np.ndarray]],
-    part_anchors: Dict[str, Dict[str, Any]],
+@dataclass
+class PartMeta:
+    """Placement fields of one manifest part, parsed once before transforms are resolved."""
+    name: str
+    t_mm: np.ndarray     # (3,) translation, already converted to mm
+    r_deg: np.ndarray    # (3,) XYZ rotation, degrees
+    mates: List[Dict[str, Any]]
+    anchors: Dict[str, int]  # anchor name -> row in the packed anchor arrays
+
+
+def parse_part_meta(
+    part_order: List[str],
+    part_cfgs: Dict[str, Dict[str, Any]],
     units_mm: float,
-) -> Tuple[np.ndarray, np.ndarray]:
+) -> Tuple[Dict[str, PartMeta], np.ndarray, np.ndarray]:
+    """
+    Normalize each part's xform/mates/anchors into a PartMeta and pack every
+    anchor into contiguous arrays.
+
+    Returns (metas, anchor_t (K,3) in mm, anchor_axis (K,3) unit vectors).
+    """
+    metas: Dict[str, PartMeta] = {}
+    ts: List[np.ndarray] = []
+    axes: List[np.ndarray] = []
+    for name in part_order:
+        p = part_cfgs[name]
+        xform = p.get("xform") or _EMPTY
+        rows: Dict[str, int] = {}
+        for anchor_name, anch in (p.get("anchors") or _EMPTY).items():
+            try:
+                t = np.asarray(anch.get("t", [0, 0, 0]), dtype=float)
+                axis = np.asarray(anch.get("axis", [0, 0, 1]), dtype=float)
+            except (AttributeError, TypeError, ValueError):
+                raise RuntimeError(f"Part '{name}': anchor '{anchor_name}' must be a mapping with numeric t/axis")
+            if t.shape != (3,) or axis.shape != (3,):
+                raise RuntimeError(f"Part '{name}': anchor '{anchor_name}' t and axis must have 3 components")
+            norm = float(np.linalg.norm(axis))
+            if norm == 0.0:
+                raise RuntimeError(f"Part '{name}': anchor '{anchor_name}' axis must be non-zero")
+            rows[anchor_name] = len(ts)
+            ts.append(t)
+            axes.append(axis / norm)
+        metas[name] = PartMeta(
+            name=name,
+            t_mm=np.asarray(xform.get("t", [0, 0, 0]), dtype=float) * units_mm,
+            r_deg=np.asarray(xform.get("r_deg", [0, 0, 0]), dtype=float),
+            mates=list(p.get("mates") or []),
+            anchors=rows,
+        )
+
+    anchor_t = np.array(ts, dtype=float).reshape(-1, 3) * units_mm
+    anchor_axis = np.array(axes, dtype=float).reshape(-1, 3)
+    return metas, anchor_t, anchor_axis
+
+
+def resolve_mate_into(
+    meta: PartMeta,
+    part_world: Dict[str, Tuple[np.ndarray, np.ndarray]],
+    metas: Dict[str, PartMeta],
+    anchor_t: np.ndarray,
+    anchor_axis: np.ndarray,
+    R_out: np.ndarray,
+    t_out: np.ndarray,
+) -> None:
     """
-    Compute world (R, t_mm) for part p using its first mate constraint.
+    Compute world (R, t_mm) for a part using its first mate constraint,
+    writing into R_out (3×3) and t_out (3,) in place.
 
     The part's xform.r_deg is applied as a pre-rotation before mating,
     letting you orient a part's "natural" axis to match the mount direction.
     xform.t is ignored when mates are defined (position comes from the mate).
+    Anchors are looked up in the arrays built by parse_part_meta.
     """
-    mates = p.get("mates") or []
-    xform = p.get("xform", {}) or {}
-    r_deg = xform.get("r_deg", [0, 0, 0])
-    my_name = p.get("name", "?")
-    my_anchors = p.get("anchors") or {}
+    R_pre = rotation_matrix_xyz(meta.r_deg)
 
-    R_pre, _ = xform_to_matrix([0, 0, 0], r_deg, units_mm)
-
-    mate = mates[0]
+    mate = meta.mates[0]
     my_anchor_name = mate.get("my_anchor")
     to_part_name = mate.get("to_part")
     to_anchor_name = mate.get("to_anchor")
 
-    if my_anchor_name not in my_anchors:
-        raise RuntimeError(f"Part '{my_name}': anchor '{my_anchor_name}' not defined")
-    my_anch = my_anchors[my_anchor_name]
-    P_me = np.array(my_anch.get("t", [0, 0, 0]), dtype=float) * units_mm
-    AX_me = np.array(my_anch.get("axis", [0, 0, 1]), dtype=float)
-    AX_me /= np.linalg.norm(AX_me)
-
-    R_target, t_target = part_world[to_part_name]
-    to_anch = part_anchors[to_part_name].get(to_anchor_name)
-    if to_anch is None:
+    my_row = meta.anchors.get(my_anchor_name)
+    if my_row is None:
+        raise RuntimeError(f"Part '{meta.name}': anchor '{my_anchor_name}' not defined")
+    to_row = metas[to_part_name].anchors.get(to_anchor_name)
+    if to_row is None:
         raise RuntimeError(f"Part '{to_part_name}': anchor '{to_anchor_name}' not defined")
-    P_to = np.array(to_anch.get("t", [0, 0, 0]), dtype=float) * units_mm
-    AX_to = np.array(to_anch.get("axis", [0, 0, 1]), dtype=float)
-    AX_to /= np.linalg.norm(AX_to)
 
-    P_to_world = R_target @ P_to + t_target
-    AX_to_world = R_target @ AX_to
+    R_target, t_target = part_world[to_part_name]
+    P_to_world = R_target @ anchor_t[to_row]
+    P_to_world += t_target
+    AX_to_world = R_target @ anchor_axis[to_row]
 
-    P_me_pre = R_pre @ P_me
-    AX_me_pre = R_pre @ AX_me
+    P_me_pre = R_pre @ anchor_t[my_row]
+    AX_me_pre = R_pre @ anchor_axis[my_row]
 
     R_align = rotation_matrix_from_vectors(AX_me_pre, AX_to_world)
-    R_world = R_align @ R_pre
-    t_world = P_to_world - R_align @ P_me_pre
+    np.matmul(R_align, R_pre, out=R_out)
+    np.subtract(P_to_world, R_align @ P_me_pre, out=t_out)
+
 
+def resolve_mate(
+    meta: PartMeta,
+    part_world: Dict[str, Tuple[np.ndarray, np.ndarray]],
+    metas: Dict[str, PartMeta],
+    anchor_t: np.ndarray,
+    anchor_axis: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """resolve_mate_into returning freshly allocated (R, t_mm)."""
+    R_world, t_world = np.empty((3, 3)), np.empty(3)
+    resolve_mate_into(meta, part_world, metas, anchor_t, anchor_axis, R_world, t_world)
     return R_world, t_world
 
 
+def resolve_world_transforms(
+    part_order: List[str],
+    metas: Dict[str, PartMeta],
+    anchor_t: np.ndarray,
+    anchor_axis: np.ndarray,
+) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    World (R, t_mm) for every part: mate-free parts from their own xform, mated parts
+    in dependency order. Raises RuntimeError on cycles or mates to unknown parts.
+    """
+    # World transforms live in two preallocated buffers; part_world maps each
+    # part to its (Rs[i], Ts[i]) views, so nothing is allocated per part.
+    row = {name: i for i, name in enumerate(part_order)}
+    Rs = np.empty((len(part_order), 3, 3))
+    Ts = np.empty((len(part_order), 3))
+    part_world: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    # Mate-free parts only depend on their own xform: place them all in one batch
+    free = [name for name in part_order if not metas[name].mates]
+    if free:
+        free_rows = [row[name] for name in free]
+        Rs[free_rows], Ts[free_rows] = xform_to_matrix_batch(
+            np.array([metas[name].t_mm for name in free]),
+            np.array([metas[name].r_deg for name in free]),
+        )
+        for name in free:
+            part_world[name] = (Rs[row[name]], Ts[row[name]])
+
+    # Mated parts: Kahn's algorithm over the mate dependency graph
+    pending: Dict[str, int] = {}
+    reverse_deps: Dict[str, List[str]] = {}
+    for name in part_order:
+        if name in part_world:
+            continue
+        deps = {m.get("to_part") for m in metas[name].mates} - part_world.keys()
+        pending[name] = len(deps)
+        for dep in deps:
+            reverse_deps.setdefault(dep, []).append(name)
+
+    ready = deque(name for name, n in pending.items() if n == 0)
+    while ready:
+        name = ready.popleft()
+        i = row[name]
+        resolve_mate_into(metas[name], part_world, metas, anchor_t, anchor_axis, Rs[i], Ts[i])
+        part_world[name] = (Rs[i], Ts[i])
+        for dependent in reverse_deps.get(name, ()):
+            pending[dependent] -= 1
+            if pending[dependent] == 0:
+                ready.append(dependent)
+
+    remaining = [name for name in part_order if name not in part_world]
+    if remaining:
+        raise RuntimeError(f"Circular or unresolvable mate dependencies: {remaining}")
+    return part_world
+
+
 def mesh_apply_transform(
     mesh: trimesh.Trimesh,
     t: Tuple[float, float, float],
     r_deg: Tuple[float, float, float],
     s: float,
-    units_mm_per_unit: float,
+    units_mm_per_unit: float = 1.0,
 ) -> trimesh.Trimesh:
     """
     Apply scale, rotation (XYZ), translation, and units to a Trimesh.
     Outputs mesh in mm space.
     """
-    # uniform scale + units
-    scale = float(s) * float(units_mm_per_unit)
-    mesh.apply_scale(scale)
-
-    # rotations
-    rx, ry, rz = [deg2rad(x) for x in r_deg]
-    if abs(rx) > 1e-12:
-        mesh.apply_transform(trimesh.transformations.rotation_matrix(rx, [1, 0, 0]))
-    if abs(ry) > 1e-12:
-        mesh.apply_transform(trimesh.transformations.rotation_matrix(ry, [0, 1, 0]))
-    if abs(rz) > 1e-12:
-        mesh.apply_transform(trimesh.transformations.rotation_matrix(rz, [0, 0, 1]))
-
-    # translation in mm
-    tx, ty, tz = [float(x) * float(units_mm_per_unit) for x in t]
-    mesh.apply_translation([tx, ty, tz])
+    # Vertices are rotated X, then Y, then Z: R = Rz @ Ry @ Rx, which is the
+    # transpose of rotation_matrix_xyz with negated angles.
+    R = rotation_matrix_xyz((-float(r_deg[0]), -float(r_deg[1]), -float(r_deg[2]))).T
+
+    # scale + rotation + translation (mm) in one pass over the vertex array
+    A = R * (float(s) * float(units_mm_per_unit))
+    t_mm = np.asarray(t, dtype=float) * float(units_mm_per_unit)
+    if np.allclose(A, np.eye(3), rtol=0.0, atol=1e-12) and not t_mm.any():
+        return mesh
+
+    v = np.asarray(mesh.vertices)
+    out = np.matmul(v, A.T, out=np.empty_like(v))
+    out += t_mm
+    if np.linalg.det(A) < 0:  # mirrored: keep faces wound outward
+        mesh.faces = mesh.faces[:, ::-1]
+    mesh.vertices = out  # assigning vertices invalidates trimesh's cached data
     return mesh
 
 
@@ -296,7 +495,7 @@ def convert_scad_to_stl(scad_path: Path, out_stl: Path, defines: Dict[str, Any]
             f"Install OpenSCAD or convert to STL yourself."
         )
 
-    cmd = [openscad, "-o", str(out_stl)]
+    cmd = [openscad, "-o", str(out_stl), *openscad_fast_flags(openscad)]
     if defines:
         for k, v in defines.items():
             # OpenSCAD -D supports expressions; strings should be quoted
@@ -311,16 +510,95 @@ def convert_scad_to_stl(scad_path: Path, out_stl: Path, defines: Dict[str, Any]
     subprocess.run(cmd, check=True)
 
 
+@functools.lru_cache(maxsize=None)
+def openscad_fast_flags(openscad: str) -> Tuple[str, ...]:
+    """
+    Speed-related CLI flags this OpenSCAD build supports, probed once from --help:
+    the Manifold geometry backend (stable --backend, or the older experimental
+    --enable=manifold) and binary STL export.
+    """
+    try:
+        proc = subprocess.run([openscad, "--help"], capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return ()
+    help_text = proc.stdout + proc.stderr
+    flags: List[str] = []
+    if "--backend" in help_text:
+        flags.append("--backend=manifold")
+    elif "manifold" in help_text:
+        flags.append("--enable=manifold")
+    if "binstl" in help_text:
+        flags += ["--export-format", "binstl"]
+    return tuple(flags)
+
+
+# Binary STL record: normal, three vertices, attribute byte count (50 bytes, little-endian)
+_STL_DTYPE = np.dtype([("normal", "<f4", (3,)), ("v", "<f4", (3, 3)), ("attr", "<u2")])
+
+
+def _fast_load_stl(path: Path) -> Optional[trimesh.Trimesh]:
+    """
+    Read a binary STL with one read + np.frombuffer, skipping trimesh's processing.
+    Returns None for ASCII (or otherwise non-binary) files so the caller can fall back.
+    Corners with bit-identical coordinates are merged into shared vertices.
+    """
+    import trimesh  # type: ignore
+
+    data = path.read_bytes()
+    if len(data) < 84:
+        return None
+    n = struct.unpack("<I", data[80:84])[0]
+    if len(data) != 84 + n * _STL_DTYPE.itemsize:
+        return None
+    tris = np.frombuffer(data, dtype=_STL_DTYPE, count=n, offset=84)
+    corners = np.ascontiguousarray(tris["v"]).reshape(-1, 3)
+    # one 12-byte key per corner: unique over raw bytes instead of a row-wise float sort
+    keys = corners.view(np.dtype((np.void, corners.dtype.itemsize * 3))).ravel()
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    return trimesh.Trimesh(
+        vertices=corners[first].astype(float), faces=inverse.reshape(-1, 3), process=False,
+    )
+
+
+def _merge_meshes(meshes: List[trimesh.Trimesh]) -> trimesh.Trimesh:
+    """Concatenate meshes into one, filling preallocated vertex/face arrays (no processing)."""
+    import trimesh  # type: ignore
+
+    V = np.empty((sum(len(m.vertices) for m in meshes), 3))
+    F = np.empty((sum(len(m.faces) for m in meshes), 3), dtype=np.int64)
+    vo = fo = 0
+    for m in meshes:
+        nv, nf = len(m.vertices), len(m.faces)
+        V[vo:vo + nv] = m.vertices
+        np.add(m.faces, vo, out=F[fo:fo + nf])
+        vo += nv
+        fo += nf
+    return trimesh.Trimesh(vertices=V, faces=F, process=False)
+
+
 def load_mesh_any(path: Path) -> trimesh.Trimesh:
+    import trimesh  # type: ignore
+
+    if path.suffix.lower() == ".stl":
+        mesh = _fast_load_stl(path)
+        if mesh is not None:
+            return mesh
     mesh = trimesh.load(str(path), force="mesh")
     if isinstance(mesh, trimesh.Scene):
-        # If it's a scene, merge into one mesh
-        mesh = trimesh.util.concatenate([g for g in mesh.geometry.values()])
+        # force="mesh" normally concatenates already; this only catches loaders that
+        # still hand back a Scene.
+        mesh = _merge_meshes([g for g in mesh.geometry.values() if isinstance(g, trimesh.Trimesh)])
     if not isinstance(mesh, trimesh.Trimesh):
         raise RuntimeError(f"Could not load mesh: {path}")
     return mesh
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_cq(path_str: str, mtime_ns: int) -> types.CodeType:
+    """Compile a generator file once per (path, mtime); a file used by several parts compiles once."""
+    return compile(Path(path_str).read_text(encoding="utf-8"), path_str, "exec")
+
+
 def load_cq_generator(py_path: Path, entry: str = "make") -> Union[cq.Assembly, cq.Shape]:
     """
     Runs a CadQuery generator python file.
@@ -329,10 +607,13 @@ def load_cq_generator(py_path: Path, entry: str = "make") -> Union[cq.Assembly,
       - cq.Workplane OR
       - cq.Shape
     """
+    import cadquery as cq  # type: ignore
+
+    code = _compile_cq(str(py_path.resolve()), py_path.stat().st_mtime_ns)
+
     # Execute in a clean globals dict with cadquery imported as cq
     g: Dict[str, Any] = {"cq": cq}
-    code = py_path.read_text(encoding="utf-8")
-    exec(compile(code, str(py_path), "exec"), g, g)
+    exec(code, g, g)
 
     if entry not in g or not callable(g[entry]):
         raise RuntimeError(f"{py_path.name} must define a callable '{entry}()'")
@@ -350,32 +631,258 @@ def load_cq_generator(py_path: Path, entry: str = "make") -> Union[cq.Assembly,
 def cq_shape_from_mesh(mesh: trimesh.Trimesh, tmp_stl: Path) -> cq.Shape:
     """
     CadQuery doesn't import GLB directly. We convert mesh -> STL -> OCC StlAPI_Reader.
+    The STL is written anyway for the PNG render, so only the read-back is extra.
+    The round-trip is deliberate: a face built from the in-memory arrays as a bare
+    Poly_Triangulation has no surface and is dropped by the AP214 STEP writer, and
+    building a planar face per triangle from Python costs more than the C++ reader.
     """
-    from OCP.StlAPI import StlAPI_Reader
-    from OCP.BRep import BRep_Builder
-    from OCP.TopoDS import TopoDS_Shape
-
     mesh.export(str(tmp_stl))
+    return read_stl_shape(tmp_stl)
+
+
+def read_stl_shape(stl_path: Path) -> cq.Shape:
+    """
+    Faceted shell from an STL: StlAPI_Reader parses in C++ and builds one planar face
+    per triangle. Faces need a surface for the STEP (AP214) writer, so mesh parts are
+    not built from a bare Poly_Triangulation.
+    """
+    import cadquery as cq  # type: ignore
+    from OCP.StlAPI import StlAPI_Reader  # type: ignore
+    from OCP.TopoDS import TopoDS_Shape  # type: ignore
+
     occ_shape = TopoDS_Shape()
-    builder = BRep_Builder()
-    reader = StlAPI_Reader()
-    reader.Read(occ_shape, str(tmp_stl))
+    StlAPI_Reader().Read(occ_shape, str(stl_path))
     return cq.Shape(occ_shape)
 
 
+def mesh_from_cq(obj: Union[cq.Shape, cq.Assembly], tolerance: float = 0.1) -> trimesh.Trimesh:
+    """Tessellate a cq.Shape (or generator assembly) into a Trimesh, in mm."""
+    import cadquery as cq  # type: ignore
+    import trimesh  # type: ignore
+
+    if isinstance(obj, cq.Assembly):
+        obj = obj.toCompound()
+    vertices, triangles = obj.tessellate(tolerance)
+    return trimesh.Trimesh(
+        vertices=[v.toTuple() for v in vertices], faces=triangles, process=False,
+    )
+
+
+def export_scene_glb(scene: trimesh.Scene, out_glb: Path) -> None:
+    """
+    Write a mm, +Z-up scene as GLB, rotated to glTF's +Y up. Units stay mm, the same
+    as the GLB cadquery's assy.save writes, so both outputs line up.
+    """
+    import trimesh  # type: ignore
+
+    scene.apply_transform(trimesh.transformations.rotation_matrix(-math.pi / 2.0, [1, 0, 0]))
+    scene.export(str(out_glb))
+
+
+# Loaded shapes keyed by (path, mtime, size, scale, loader options). Parts that
+# reference the same file share one cq.Shape; placement lives in the assembly Location.
+# Shapes are also persisted as BREP under <out_dir>/.cache; with --reuse later runs
+# pick up the entries recorded in <out_dir>/.build.json and skip the import. Keys only
+# track the part file itself, not files it includes/imports, so without --reuse both
+# caches are cleared before each build.
+# In-memory entries are LRU-bounded so long-lived processes don't hold every shape.
+_SHAPE_CACHE_SIZE = 256
+_shape_cache: "OrderedDict[Tuple[Any, ...], cq.Shape]" = OrderedDict()
+
+
 def cq_load_part(
     part_file: Path,
     part_cfg: Dict[str, Any],
     build_dir: Path,
     units_mm_per_unit: float,
-) -> Tuple[Union[cq.Shape, cq.Assembly], Optional[str]]:
+    mesh_only: bool = False,
+) -> Tuple[Union[cq.Shape, cq.Assembly, trimesh.Trimesh], Optional[str]]:
     """
-    Returns (shape_or_assembly, kind) where kind is "assembly" or None
+    Returns (shape_or_assembly, kind) where kind is "assembly" or None.
+    Shapes are cached so repeated parts load their file only once.
+
+    With mesh_only=True, mesh files (STL/GLB/GLTF/OBJ/PLY) are returned as a scaled
+    trimesh.Trimesh with kind "mesh" and never converted to an OCC shape.
     """
+    xform = part_cfg.get("xform") or _EMPTY
+    if mesh_only and part_file.suffix.lower() in [".stl", ".glb", ".gltf", ".obj", ".ply"]:
+        mesh = load_mesh_any(part_file)
+        mesh.apply_scale(float(xform.get("s", 1.0)) * float(units_mm_per_unit))
+        if part_file.suffix.lower() != ".stl":
+            # the PNG render imports this STL
+            mesh.export(str(intermediate_stl(part_file, build_dir)))
+        return mesh, "mesh"
+
+    key = _part_cache_key(part_file, part_cfg, units_mm_per_unit)
+    shape = _shape_cache.get(key)
+    if shape is not None:
+        _shape_cache.move_to_end(key)
+        return shape, None
+
+    brep = _brep_cache_path(build_dir, key)
+    if brep.exists():
+        obj, kind = read_brep(brep), None
+    else:
+        obj, kind = _cq_load_part_uncached(part_file, part_cfg, build_dir, units_mm_per_unit)
+        if kind is None:
+            write_brep(obj, brep)
+    if kind is None:  # generator assemblies are rebuilt per part
+        _shape_cache[key] = obj
+        if len(_shape_cache) > _SHAPE_CACHE_SIZE:
+            _shape_cache.popitem(last=False)
+    return obj, kind
+
+
+def _part_cache_key(part_file: Path, part_cfg: Dict[str, Any], units_mm_per_unit: float) -> Tuple[Any, ...]:
+    xform = part_cfg.get("xform") or _EMPTY
+    st = part_file.stat()
+    return (
+        part_file.resolve(),
+        st.st_mtime_ns,
+        st.st_size,
+        float(xform.get("s", 1.0)) * units_mm_per_unit,
+        repr(sorted(((part_cfg.get("scad") or _EMPTY).get("defines") or _EMPTY).items())),
+        (part_cfg.get("cq") or _EMPTY).get("entry", "make"),
+    )
+
+
+def _brep_cache_path(build_dir: Path, key: Tuple[Any, ...]) -> Path:
+    return build_dir / ".cache" / f"{hashlib.sha1(repr(key).encode()).hexdigest()}.brep"
+
+
+def intermediate_stl(part_file: Path, build_dir: Path) -> Optional[Path]:
+    """STL a part's loader writes into build_dir (mesh conversion / OpenSCAD output), if any."""
+    suffix = part_file.suffix.lower()
+    if suffix in [".glb", ".gltf", ".obj", ".ply"]:
+        return build_dir / f"{part_file.stem}.converted.stl"
+    if suffix == ".scad":
+        return build_dir / f"{part_file.stem}.scad.stl"
+    return None
+
+
+def _load_part_worker(
+    part_cfgs: List[Dict[str, Any]],
+    build_dir: Path,
+    units_mm_per_unit: float,
+    mesh_only: bool,
+) -> List[Tuple[Any, str]]:
+    """
+    Process-pool entry point: load the given parts one after another (they share
+    intermediate build outputs), and return picklable results:
+      - (trimesh.Trimesh, "mesh") for mesh-only parts
+      - (brep_path, "brep") for shapes, written to the BREP build cache
+    Generator (.py) parts are not sent here; they may return an Assembly, which
+    can't come back through the BREP cache.
+    """
+    results: List[Tuple[Any, str]] = []
+    for cfg in part_cfgs:
+        part_file = cfg["_path"]
+        if mesh_only and part_file.suffix.lower() in [".stl", ".glb", ".gltf", ".obj", ".ply"]:
+            results.append(cq_load_part(part_file, cfg, build_dir, units_mm_per_unit, mesh_only=True))
+            continue
+        brep = _brep_cache_path(build_dir, _part_cache_key(part_file, cfg, units_mm_per_unit))
+        if not brep.exists():
+            obj, _ = _cq_load_part_uncached(part_file, cfg, build_dir, units_mm_per_unit)
+            write_brep(obj, brep)
+        results.append((brep, "brep"))
+    return results
+
+
+def write_build_lock(
+    out_dir: Path,
+    part_order: List[str],
+    part_cfgs: Dict[str, Dict[str, Any]],
+    units_mm_per_unit: float,
+) -> None:
+    """
+    Write <out_dir>/.build.json after a successful build: per part, the source file
+    stamp and the cached BREP it was loaded from (read back by check_build_lock).
+    BREPs no part references any more (superseded keys) are deleted.
+    """
+    lock: Dict[str, Any] = {}
+    for name in part_order:
+        key = _part_cache_key(part_cfgs[name]["_path"], part_cfgs[name], units_mm_per_unit)
+        brep = _brep_cache_path(out_dir, key)
+        lock[name] = {
+            "file": str(key[0]),
+            "mtime_ns": key[1],
+            "size": key[2],
+            # mesh-only and generator-assembly parts have none (or keep an earlier build's)
+            "brep": brep.name if brep.exists() else None,
+        }
+    (out_dir / ".build.json").write_text(json.dumps({"parts": lock}, indent=2) + "\n")
+    _prune_brep_cache(out_dir, {entry["brep"] for entry in lock.values()})
+
+
+def check_build_lock(
+    out_dir: Path,
+    part_order: List[str],
+    part_cfgs: Dict[str, Dict[str, Any]],
+    units_mm_per_unit: float,
+    mesh_only: bool = False,
+) -> List[str]:
+    """
+    Drop cached BREPs the previous <out_dir>/.build.json doesn't record (e.g. left by
+    a build that failed), so those parts are rebuilt, and return the names of parts
+    whose recorded BREP is still there.
+    """
+    try:
+        lock = json.loads((out_dir / ".build.json").read_text(encoding="utf-8")).get("parts") or {}
+    except (OSError, ValueError, AttributeError):
+        lock = {}
+    _prune_brep_cache(out_dir, {entry.get("brep") for entry in lock.values() if isinstance(entry, dict)})
+
+    reused: List[str] = []
+    for name in part_order:
+        part_file = part_cfgs[name]["_path"]
+        if mesh_only and part_file.suffix.lower() in [".stl", ".glb", ".gltf", ".obj", ".ply"]:
+            continue
+        if _brep_cache_path(out_dir, _part_cache_key(part_file, part_cfgs[name], units_mm_per_unit)).exists():
+            reused.append(name)
+    return reused
+
+
+def _prune_brep_cache(out_dir: Path, keep: Set[Optional[str]]) -> None:
+    cache_dir = out_dir / ".cache"
+    if cache_dir.is_dir():
+        for brep in cache_dir.glob("*.brep"):
+            if brep.name not in keep:
+                brep.unlink(missing_ok=True)
+
+
+def read_brep(path: Path) -> cq.Shape:
+    import cadquery as cq  # type: ignore
+    from OCP.BRep import BRep_Builder  # type: ignore
+    from OCP.BRepTools import BRepTools  # type: ignore
+    from OCP.TopoDS import TopoDS_Shape  # type: ignore
+
+    occ_shape = TopoDS_Shape()
+    BRepTools.Read_s(occ_shape, str(path), BRep_Builder())
+    return cq.Shape(occ_shape)
+
+
+def write_brep(shape: cq.Shape, path: Path) -> None:
+    """Write shape as OCC BREP; written to a temp name first so readers never see a partial file."""
+    from OCP.BRepTools import BRepTools  # type: ignore
+
+    ensure_dir(path.parent)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")  # per process: two workers may share a key
+    BRepTools.Write_s(shape.wrapped, str(tmp))
+    os.replace(tmp, path)
+
+
+def _cq_load_part_uncached(
+    part_file: Path,
+    part_cfg: Dict[str, Any],
+    build_dir: Path,
+    units_mm_per_unit: float,
+) -> Tuple[Union[cq.Shape, cq.Assembly], Optional[str]]:
+    import cadquery as cq  # type: ignore
+
     suffix = part_file.suffix.lower()
 
     # transforms in manifest
-    xform = part_cfg.get("xform", {}) or {}
+    xform = part_cfg.get("xform") or _EMPTY
     t = tuple(xform.get("t", [0, 0, 0]))
     r = tuple(xform.get("r_deg", [0, 0, 0]))
     s = float(xform.get("s", 1.0))
@@ -392,13 +899,7 @@ def cq_load_part(
 
     if suffix == ".stl":
         # STL is mesh -> faceted shell/solid representation in cq
-        from OCP.StlAPI import StlAPI_Reader
-        from OCP.BRep import BRep_Builder
-        from OCP.TopoDS import TopoDS_Shape
-        occ_shape = TopoDS_Shape()
-        BRep_Builder()
-        StlAPI_Reader().Read(occ_shape, str(part_file))
-        shape = cq.Shape(occ_shape)
+        shape = read_stl_shape(part_file)
         if abs(s * units_mm_per_unit - 1.0) > 1e-12:
             shape = shape.scale(s * units_mm_per_unit)
         return shape, None
@@ -407,26 +908,22 @@ def cq_load_part(
         mesh = load_mesh_any(part_file)
         # Only bake scale; rotation+translation are applied via Location in build_assembly
         mesh.apply_scale(float(s) * float(units_mm_per_unit))
-        tmp_stl = build_dir / f"{part_file.stem}.converted.stl"
+        tmp_stl = intermediate_stl(part_file, build_dir)
         shape = cq_shape_from_mesh(mesh, tmp_stl)
         return shape, None
 
     if suffix == ".scad":
-        defines = (part_cfg.get("scad", {}) or {}).get("defines", None)
-        tmp_stl = build_dir / f"{part_file.stem}.scad.stl"
+        defines = (part_cfg.get("scad") or _EMPTY).get("defines", None)
+        tmp_stl = intermediate_stl(part_file, build_dir)
         convert_scad_to_stl(part_file, tmp_stl, defines)
-        from OCP.StlAPI import StlAPI_Reader
-        from OCP.TopoDS import TopoDS_Shape
-        occ_shape = TopoDS_Shape()
-        StlAPI_Reader().Read(occ_shape, str(tmp_stl))
-        shape = cq.Shape(occ_shape)
+        shape = read_stl_shape(tmp_stl)
         # apply placement via Location later; apply scale via shape.scale
         if abs(s * units_mm_per_unit - 1.0) > 1e-12:
             shape = shape.scale(s * units_mm_per_unit)
         return shape, None
 
     if suffix == ".py":
-        entry = (part_cfg.get("cq", {}) or {}).get("entry", "make")
+        entry = (part_cfg.get("cq") or _EMPTY).get("entry", "make")
         obj = load_cq_generator(part_file, entry=entry)
         # If it’s an Assembly, we’ll nest it later.
         if isinstance(obj, cq.Assembly):
@@ -458,7 +955,8 @@ def render_assembly_png(
     if not openscad:
         raise RuntimeError("OpenSCAD CLI not found, needed for PNG rendering")
 
-    # Compute assembly bounding box from transformed mesh vertices for camera placement
+    # Compute assembly bounding box from transformed mesh vertices for camera placement.
+    # float32 is plenty for framing the camera and halves the vertex traffic.
     all_verts: List[np.ndarray] = []
     for name in part_order:
         stl = part_stl.get(name)
@@ -466,8 +964,8 @@ def render_assembly_png(
             continue
         mesh = load_mesh_any(stl)
         R, t = part_world[name]
-        v = np.array(mesh.vertices)
-        all_verts.append((R @ v.T).T + t)
+        v = np.asarray(mesh.vertices, dtype=np.float32)
+        all_verts.append(v @ R.T.astype(np.float32) + t.astype(np.float32))
 
     if not all_verts:
         raise RuntimeError("No STL parts available for PNG rendering")
@@ -509,7 +1007,24 @@ def render_assembly_png(
 # Main build
 # ----------------------------
 
-def build_assembly(manifest: Dict[str, Any], manifest_path: Path) -> Tuple[cq.Assembly, Path]:
+def build_assembly(
+    manifest: Dict[str, Any],
+    manifest_path: Path,
+    mesh_only: bool = False,
+    reuse: bool = False,
+) -> Tuple[cq.Assembly, Path]:
+    """
+    With mesh_only=True the parts are placed into a trimesh.Scene (returned last)
+    instead of the cq.Assembly, for runs that only export GLB.
+
+    With reuse=True, shapes cached under <out_dir>/.cache by an earlier run are kept
+    and parts whose file (mtime, size) and loader options are unchanged skip loading.
+    Only cache entries recorded in <out_dir>/.build.json, which is written once the
+    build succeeds, are trusted; the rest are rebuilt.
+    """
+    import cadquery as cq  # type: ignore
+    import trimesh  # type: ignore
+
     units = manifest.get("units", "mm")
     units_mm = unit_scale(units)
 
@@ -517,6 +1032,9 @@ def build_assembly(manifest: Dict[str, Any], manifest_path: Path) -> Tuple[cq.As
     if not out_dir.is_absolute():
         out_dir = manifest_path.parent / out_dir
     ensure_dir(out_dir)
+    if not reuse:
+        shutil.rmtree(out_dir / ".cache", ignore_errors=True)
+        _shape_cache.clear()
 
     assy = cq.Assembly(name=manifest.get("name", "root"))
 
@@ -544,43 +1062,53 @@ def build_assembly(manifest: Dict[str, Any], manifest_path: Path) -> Tuple[cq.As
         part_cfgs[name] = cfg
         part_order.append(name)
 
-    # Phase 1: Load all shapes
+    if reuse:
+        reused = check_build_lock(out_dir, part_order, part_cfgs, units_mm, mesh_only)
+        print(f"Reused:     {len(reused)}/{len(part_order)} parts unchanged ({', '.join(reused) or 'none'})")
+
+    # Phase 1: Load all shapes. Parts that share a source file or an intermediate STL
+    # name (same stem in different directories) go to one worker process, which loads
+    # them in order (OCC imports hold the GIL, so threads wouldn't overlap them); the
+    # results come back through the BREP build cache and are picked up here by
+    # cq_load_part. Generators (.py) run here in-process, since they may return an Assembly.
     shapes: Dict[str, Tuple[Any, Optional[str]]] = {}
+    by_output: Dict[Path, List[str]] = {}
+    for name in part_order:
+        part_file = part_cfgs[name]["_path"]
+        if part_file.suffix.lower() != ".py":
+            group = intermediate_stl(part_file, out_dir) or part_file.resolve()
+            by_output.setdefault(group, []).append(name)
+    if len(by_output) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(by_output), os.cpu_count() or 1)) as ex:
+            futures = {
+                group: ex.submit(_load_part_worker, [part_cfgs[n] for n in names], out_dir, units_mm, mesh_only)
+                for group, names in by_output.items()
+            }
+            for group, names in by_output.items():
+                for name, (obj, kind) in zip(names, futures[group].result()):
+                    if kind == "mesh":
+                        shapes[name] = (obj, kind)
     for name in part_order:
-        obj, kind = cq_load_part(part_cfgs[name]["_path"], part_cfgs[name], out_dir, units_mm)
-        shapes[name] = (obj, kind)
+        if name not in shapes:
+            shapes[name] = cq_load_part(part_cfgs[name]["_path"], part_cfgs[name], out_dir, units_mm, mesh_only)
 
     # Phase 2: Resolve world transforms (topological, supports mate dependencies)
-    part_anchors: Dict[str, Dict[str, Any]] = {
-        name: (part_cfgs[name].get("anchors") or {}) for name in part_order
-    }
-    part_world: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
-    remaining = list(part_order)
-    for _ in range(len(part_order) + 1):
-        if not remaining:
-            break
-        deferred: List[str] = []
-        for name in remaining:
-            p = part_cfgs[name]
-            xform = p.get("xform", {}) or {}
-            t = tuple(xform.get("t", [0, 0, 0]))
-            r = tuple(xform.get("r_deg", [0, 0, 0]))
-            mates = p.get("mates") or []
-            if not mates:
-                part_world[name] = xform_to_matrix(t, r, units_mm)
-            elif all(m.get("to_part") in part_world for m in mates):
-                part_world[name] = resolve_mate(p, part_world, part_anchors, units_mm)
-            else:
-                deferred.append(name)
-        remaining = deferred
-    if remaining:
-        raise RuntimeError(f"Circular or unresolvable mate dependencies: {remaining}")
+    metas, anchor_t, anchor_axis = parse_part_meta(part_order, part_cfgs, units_mm)
+    part_world = resolve_world_transforms(part_order, metas, anchor_t, anchor_axis)
 
-    # Phase 3: Add parts to assembly with resolved locations
+    # Phase 3: Add parts to assembly (or the mesh scene) with resolved locations
+    mesh_scene = trimesh.Scene() if mesh_only else None
     for name in part_order:
         obj, kind = shapes[name]
         R, t_mm = part_world[name]
-        assy.add(obj, name=name, loc=matrix_to_location(R, t_mm))
+        if mesh_scene is not None:
+            M = np.eye(4)
+            M[:3, :3] = R
+            M[:3, 3] = t_mm
+            mesh = obj if kind == "mesh" else mesh_from_cq(obj)
+            mesh_scene.add_geometry(mesh, node_name=name, geom_name=name, transform=M)
+        else:
+            assy.add(obj, name=name, loc=matrix_to_location(R, t_mm))
 
     # Map each part name to its intermediate STL path (used for PNG rendering)
     part_stl: Dict[str, Path] = {}
@@ -589,12 +1117,27 @@ def build_assembly(manifest: Dict[str, Any], manifest_path: Path) -> Tuple[cq.As
         suffix = part_file.suffix.lower()
         if suffix == ".stl":
             part_stl[name] = part_file
-        elif suffix in [".glb", ".gltf", ".obj", ".ply"]:
-            part_stl[name] = out_dir / f"{part_file.stem}.converted.stl"
-        elif suffix == ".scad":
-            part_stl[name] = out_dir / f"{part_file.stem}.scad.stl"
+        elif suffix in [".glb", ".gltf", ".obj", ".ply", ".scad"]:
+            part_stl[name] = intermediate_stl(part_file, out_dir)
+
+    write_build_lock(out_dir, part_order, part_cfgs, units_mm)
+    return assy, out_dir, part_order, part_world, part_stl, mesh_scene
 
-    return assy, out_dir, part_order, part_world, part_stl
+
+def save_step(assy: cq.Assembly, out_step: Path, precision_mm: float = 0.01) -> None:
+    """
+    Export the assembly as STEP without p-curves and with a fixed, coarser declared
+    precision: smaller files that are faster to write and to read back.
+    """
+    from OCP.Interface import Interface_Static  # type: ignore
+    from OCP.STEPControl import STEPControl_Controller  # type: ignore
+
+    STEPControl_Controller.Init_s()  # registers the write.* parameters
+    Interface_Static.SetIVal_s("write.step.assembly", 1)
+    Interface_Static.SetRVal_s("write.precision.val", precision_mm)
+    # cadquery sets write.surfacecurve.mode / write.precision.mode itself from these
+    # (precision_mode 2 = "session": use write.precision.val)
+    assy.save(str(out_step), write_pcurves=False, precision_mode=2)
 
 
 def main() -> int:
@@ -603,29 +1146,46 @@ def main() -> int:
     ap.add_argument("--out", type=str, default="assembly.step", help="Output STEP path")
     ap.add_argument("--outglb", type=str, default="", help="Optional output GLB path")
     ap.add_argument("--outpng", type=str, default="assembly.png", help="Output isometric PNG path ('' to skip)")
+    ap.add_argument(
+        "--no-step", action="store_true",
+        help="Skip STEP output; mesh parts go straight to the GLB without OCC conversion (requires --outglb)",
+    )
+    ap.add_argument(
+        "--reuse", action="store_true",
+        help="Keep shapes cached in out_dir by earlier runs; parts whose files are unchanged skip loading",
+    )
     args = ap.parse_args()
+    if args.no_step and not args.outglb:
+        ap.error("--no-step requires --outglb")
 
     manifest_path = Path(args.manifest).resolve()
     manifest = load_manifest(manifest_path)
 
-    assy, out_dir, part_order, part_world, part_stl = build_assembly(manifest, manifest_path)
+    assy, out_dir, part_order, part_world, part_stl, mesh_scene = build_assembly(
+        manifest, manifest_path, mesh_only=args.no_step, reuse=args.reuse,
+    )
 
-    out_step = Path(args.out)
-    if not out_step.is_absolute():
-        out_step = out_dir / out_step.name
+    if not args.no_step:
+        out_step = Path(args.out)
+        if not out_step.is_absolute():
+            out_step = out_dir / out_step.name
 
-    assy.save(str(out_step))
-    print(f"Wrote STEP: {out_step}")
+        save_step(assy, out_step)
+        print(f"Wrote STEP: {out_step}")
 
     if args.outglb:
         out_glb = Path(args.outglb)
         if not out_glb.is_absolute():
             out_glb = out_dir / out_glb.name
         try:
-            assy.save(str(out_glb))
+            if mesh_scene is not None:
+                export_scene_glb(mesh_scene, out_glb)
+            else:
+                assy.save(str(out_glb))
             print(f"Wrote GLB:  {out_glb}")
         except Exception as e:
-            print(f"GLB export failed (STEP still written): {e}", file=sys.stderr)
+            note = "" if args.no_step else " (STEP still written)"
+            print(f"GLB export failed{note}: {e}", file=sys.stderr)
 
     if args.outpng:
         out_png = Path(args.outpng)
@@ -0,0 +1,229 @@
+import importlib.util
+import math
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import trimesh
+
+import assemble
+
+HERE = Path(__file__).resolve().parent
+
+
+def _matmul_xyz(r_deg):
+    """Reference rotation: explicit Rx @ Ry @ Rz, as xform_to_matrix used to build it."""
+    rx, ry, rz = [math.radians(float(x)) for x in r_deg]
+    cx, sx = math.cos(rx), math.sin(rx)
+    cy, sy = math.cos(ry), math.sin(ry)
+    cz, sz = math.cos(rz), math.sin(rz)
+    Rx = np.array([[1, 0, 0], [0, cx, -sx], [0, sx, cx]], dtype=float)
+    Ry = np.array([[cy, 0, sy], [0, 1, 0], [-sy, 0, cy]], dtype=float)
+    Rz = np.array([[cz, -sz, 0], [sz, cz, 0], [0, 0, 1]], dtype=float)
+    return Rx @ Ry @ Rz
+
+
+class RotationMatrixXYZTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.angles = [(0, 0, 0), (90, 0, 0), (0, 90, 0), (0, 0, 90), (180, -90, 45), (30.5, 60.25, -120.125)]
+        self.angles += [tuple(a) for a in rng.uniform(-360.0, 360.0, size=(200, 3))]
+
+    def test_closed_form_matches_matmul(self):
+        for r in self.angles:
+            np.testing.assert_allclose(assemble.rotation_matrix_xyz(r), _matmul_xyz(r), rtol=0, atol=1e-12)
+
+    def test_xform_to_matrix(self):
+        for r in self.angles:
+            R, t = assemble.xform_to_matrix((1, 2, 3), r, 25.4)
+            np.testing.assert_allclose(R, _matmul_xyz(r), rtol=0, atol=1e-12)
+            np.testing.assert_allclose(t, [25.4, 50.8, 76.2], rtol=0, atol=1e-12)
+
+    def test_batch_matches_matmul(self):
+        Rs, _ = assemble.xform_to_matrix_batch(np.zeros((len(self.angles), 3)), np.array(self.angles, dtype=float))
+        for R, r in zip(Rs, self.angles):
+            np.testing.assert_allclose(R, _matmul_xyz(r), rtol=0, atol=1e-12)
+
+
+class ParsePartMetaTest(unittest.TestCase):
+    def _parse(self, anchor):
+        return assemble.parse_part_meta(["a"], {"a": {"anchors": {"pin": anchor}}}, 1.0)
+
+    def test_packs_anchors_in_mm_with_unit_axes(self):
+        metas, anchor_t, anchor_axis = assemble.parse_part_meta(
+            ["a"], {"a": {"anchors": {"pin": {"t": [1, 2, 3], "axis": [0, 0, 2]}}}}, 25.4,
+        )
+        row = metas["a"].anchors["pin"]
+        np.testing.assert_allclose(anchor_t[row], [25.4, 50.8, 76.2])
+        np.testing.assert_allclose(anchor_axis[row], [0, 0, 1])
+
+    def test_anchor_errors_name_part_and_anchor(self):
+        cases = [
+            ({"t": [1, 2]}, "Part 'a': anchor 'pin' t and axis must have 3 components"),
+            ({"axis": [1, 0]}, "Part 'a': anchor 'pin' t and axis must have 3 components"),
+            ({"axis": [0, 0, 0]}, "Part 'a': anchor 'pin' axis must be non-zero"),
+            ({"t": ["x", 0, 0]}, "Part 'a': anchor 'pin' must be a mapping with numeric t/axis"),
+            ([0, 0, 1], "Part 'a': anchor 'pin' must be a mapping with numeric t/axis"),
+        ]
+        for anchor, message in cases:
+            with self.subTest(anchor=anchor):
+                with self.assertRaises(RuntimeError) as ctx:
+                    self._parse(anchor)
+                self.assertEqual(str(ctx.exception), message)
+
+
+def _mate(my_anchor, to_part, to_anchor):
+    return {"my_anchor": my_anchor, "to_part": to_part, "to_anchor": to_anchor}
+
+
+class ResolveWorldTransformsTest(unittest.TestCase):
+    def _resolve(self, part_order, part_cfgs):
+        metas, anchor_t, anchor_axis = assemble.parse_part_meta(part_order, part_cfgs, 1.0)
+        return assemble.resolve_world_transforms(part_order, metas, anchor_t, anchor_axis)
+
+    def test_two_level_mate_chain(self):
+        part_cfgs = {
+            # listed before the parts it mates to
+            "tip": {
+                "xform": {"r_deg": [0, -90, 0]},
+                "anchors": {"base": {"t": [1, 0, 0], "axis": [1, 0, 0]}},
+                "mates": [_mate("base", "mid", "top")],
+            },
+            "mid": {
+                "anchors": {"bottom": {"t": [0, 0, -2]}, "top": {"t": [0, 0, 3]}},
+                "mates": [_mate("bottom", "base", "top")],
+            },
+            "base": {
+                "xform": {"t": [10, 0, 0], "r_deg": [0, 0, 90]},
+                "anchors": {"top": {"t": [1, 0, 5]}},
+            },
+        }
+        world = self._resolve(["tip", "mid", "base"], part_cfgs)
+
+        np.testing.assert_allclose(world["base"][0], _matmul_xyz((0, 0, 90)), atol=1e-12)
+        np.testing.assert_allclose(world["base"][1], [10, 0, 0], atol=1e-12)
+        # base's top anchor lands at (10, 1, 5); mid's bottom anchor sits 2 below its origin
+        np.testing.assert_allclose(world["mid"][0], np.eye(3), atol=1e-12)
+        np.testing.assert_allclose(world["mid"][1], [10, 1, 7], atol=1e-12)
+        # mid's top anchor is at (10, 1, 10); tip's pre-rotated anchor points +Z, offset (0, 0, 1)
+        np.testing.assert_allclose(world["tip"][0], _matmul_xyz((0, -90, 0)), atol=1e-12)
+        np.testing.assert_allclose(world["tip"][1], [10, 1, 9], atol=1e-12)
+
+    def test_cycle_raises(self):
+        anchors = {"a": {}}
+        part_cfgs = {
+            "root": {},
+            "c1": {"anchors": anchors, "mates": [_mate("a", "c2", "a")]},
+            "c2": {"anchors": anchors, "mates": [_mate("a", "c1", "a")]},
+        }
+        with self.assertRaises(RuntimeError) as ctx:
+            self._resolve(["root", "c1", "c2"], part_cfgs)
+        self.assertEqual(str(ctx.exception), "Circular or unresolvable mate dependencies: ['c1', 'c2']")
+
+    def test_unknown_to_part_raises(self):
+        part_cfgs = {"a": {"anchors": {"p": {}}, "mates": [_mate("p", "missing", "p")]}}
+        with self.assertRaises(RuntimeError) as ctx:
+            self._resolve(["a"], part_cfgs)
+        self.assertEqual(str(ctx.exception), "Circular or unresolvable mate dependencies: ['a']")
+
+    def test_undefined_anchor_raises(self):
+        part_cfgs = {"base": {}, "a": {"mates": [_mate("p", "base", "q")]}}
+        with self.assertRaises(RuntimeError) as ctx:
+            self._resolve(["base", "a"], part_cfgs)
+        self.assertEqual(str(ctx.exception), "Part 'a': anchor 'p' not defined")
+
+
+class SceneGlbTest(unittest.TestCase):
+    def test_keeps_mm_and_turns_z_up_to_y_up(self):
+        scene = trimesh.Scene()
+        scene.add_geometry(trimesh.creation.box(extents=(10.0, 20.0, 30.0)), node_name="box")
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "out.glb"
+            assemble.export_scene_glb(scene, out)
+            bounds = trimesh.load(str(out)).bounds
+        np.testing.assert_allclose(bounds, [[-5.0, -15.0, -10.0], [5.0, 15.0, 10.0]], atol=1e-6)
+
+    @unittest.skipUnless(importlib.util.find_spec("cadquery"), "cadquery not installed")
+    def test_no_step_glb_matches_assembly_glb(self):
+        manifest = {
+            "name": "glb-check",
+            "parts": [
+                {"name": "head", "file": str(HERE / "bender-head.stl"), "xform": {"t": [40, 0, 0]}},
+                {"name": "motor", "file": str(HERE / "motor.glb"), "xform": {"r_deg": [0, 90, 0], "s": 1000.0}},
+            ],
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest["out_dir"] = tmp
+            manifest_path = Path(tmp) / "manifest.yaml"
+            assy = assemble.build_assembly(manifest, manifest_path)[0]
+            assy.save(str(Path(tmp) / "assy.glb"))
+            scene = assemble.build_assembly(manifest, manifest_path, mesh_only=True)[-1]
+            assemble.export_scene_glb(scene, Path(tmp) / "scene.glb")
+            np.testing.assert_allclose(
+                trimesh.load(str(Path(tmp) / "scene.glb")).bounds,
+                trimesh.load(str(Path(tmp) / "assy.glb")).bounds,
+                atol=0.5,
+            )
+
+
+class FastLoadStlTest(unittest.TestCase):
+    def test_matches_trimesh_load(self):
+        for name in ["bender-head.stl", "motor-flange.stl"]:
+            with self.subTest(name):
+                fast = assemble._fast_load_stl(HERE / name)
+                ref = trimesh.load(str(HERE / name), force="mesh")
+                self.assertIsNotNone(fast)
+                self.assertEqual(len(fast.vertices), len(ref.vertices))
+                self.assertEqual(len(fast.faces), len(ref.faces))
+                np.testing.assert_allclose(np.sort(fast.area_faces), np.sort(ref.area_faces), rtol=1e-6)
+
+    def test_ascii_falls_back_to_trimesh(self):
+        box = trimesh.creation.box()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "box.stl"
+            path.write_text(trimesh.exchange.stl.export_stl_ascii(box))
+            self.assertIsNone(assemble._fast_load_stl(path))
+            mesh = assemble.load_mesh_any(path)
+        self.assertEqual(len(mesh.faces), len(box.faces))
+        self.assertAlmostEqual(mesh.area, box.area)
+
+    def test_truncated_returns_none(self):
+        data = (HERE / "bender-head.stl").read_bytes()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cut.stl"
+            path.write_bytes(data[:-10])
+            self.assertIsNone(assemble._fast_load_stl(path))
+            path.write_bytes(data[:50])
+            self.assertIsNone(assemble._fast_load_stl(path))
+
+
+class BuildLockTest(unittest.TestCase):
+    def test_reuse_trusts_recorded_breps_and_prunes_the_rest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out_dir = Path(tmp)
+            part = out_dir / "p.step"
+            part.write_text("v1")
+            cfgs = {"p": {"_path": part}}
+
+            def brep_path():
+                return assemble._brep_cache_path(out_dir, assemble._part_cache_key(part, cfgs["p"], 1.0))
+
+            old = brep_path()
+            assemble.ensure_dir(old.parent)
+            old.write_text("brep")
+            (old.parent / "stray.brep").write_text("brep")
+            assemble.write_build_lock(out_dir, ["p"], cfgs, 1.0)
+            self.assertEqual([b.name for b in old.parent.glob("*.brep")], [old.name])
+            self.assertEqual(assemble.check_build_lock(out_dir, ["p"], cfgs, 1.0), ["p"])
+
+            # editing the part supersedes its key; the new lock drops the old BREP
+            part.write_text("version 2")
+            self.assertEqual(assemble.check_build_lock(out_dir, ["p"], cfgs, 1.0), [])
+            brep_path().write_text("brep")
+            assemble.write_build_lock(out_dir, ["p"], cfgs, 1.0)
+            self.assertEqual([b.name for b in old.parent.glob("*.brep")], [brep_path().name])
+
+
+if __name__ == "__main__":
+    unittest.main()